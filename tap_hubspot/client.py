@@ -8,25 +8,187 @@
 
 from __future__ import annotations
 
+import aiohttp
+import asyncio
+import atexit
+import orjson
+import random
 import requests
+import threading
 
-from typing import Any, Callable, Iterable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import cached_property
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Sequence
+from requests.adapters import HTTPAdapter
 from singer_sdk.authenticators import BearerTokenAuthenticator
 from singer_sdk.helpers.jsonpath import extract_jsonpath
 from singer_sdk.pagination import BaseAPIPaginator, BaseHATEOASPaginator
 from singer_sdk.streams import RESTStream
 
+try:
+    import uvloop
+except ImportError:  # optional extra, not available on Windows
+    uvloop = None
+
 _Auth = Callable[[requests.PreparedRequest], requests.PreparedRequest]
 
+MAX_CONCURRENCY = 32  # default for the max_concurrency setting
+MAX_RETRIES = 8  # attempts per request on throttling, server or connection errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_DELAY = 60  # seconds, caps the backoff and any Retry-After value
+QUEUE_SIZE = 64  # results buffered between the fetches and get_records
+_DONE = object()  # posted by a fan-out worker once it runs out of items
+
+# Shared by every stream so keep-alive connections to the API are reused
+_SESSION = requests.Session()
+for _scheme in ("https://", "http://"):
+    _SESSION.mount(
+        _scheme, HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=3)
+    )
+
+# One event loop for the whole process and one aiohttp session per tap
+# configuration, shared by the aiohttp based streams so keep-alive
+# connections survive between streams. Sessions are keyed on the headers,
+# which carry the access token, and the pool size, so taps with different
+# configs in one process never send each other's token. The loop runs in a
+# background thread so requests keep flowing while the main thread writes
+# records.
+_EVENT_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_THREAD: threading.Thread | None = None
+_AIOHTTP_SESSIONS: dict[tuple, aiohttp.ClientSession] = {}
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop, starting its thread on first use."""
+    global _EVENT_LOOP, _LOOP_THREAD
+    if _EVENT_LOOP is None or _EVENT_LOOP.is_closed() or not _LOOP_THREAD.is_alive():
+        _EVENT_LOOP = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        _LOOP_THREAD = threading.Thread(
+            target=_EVENT_LOOP.run_forever, name="tap-hubspot-event-loop", daemon=True
+        )
+        _LOOP_THREAD.start()
+    return _EVENT_LOOP
+
+
+async def _await(awaitable: Any) -> Any:
+    """Wrap any awaitable in a coroutine so it can be sent to the loop thread."""
+    return await awaitable
+
+
+def _close_event_loop() -> None:
+    """Close the shared aiohttp sessions and event loop at interpreter exit."""
+    if _EVENT_LOOP is None or _EVENT_LOOP.is_closed():
+        return
+    if _LOOP_THREAD.is_alive():
+        for session in _AIOHTTP_SESSIONS.values():
+            if not session.closed:
+                asyncio.run_coroutine_threadsafe(session.close(), _EVENT_LOOP).result()
+        _EVENT_LOOP.call_soon_threadsafe(_EVENT_LOOP.stop)
+        _LOOP_THREAD.join()
+    _EVENT_LOOP.close()
+
+
+atexit.register(_close_event_loop)
+
+
+async def cancel_tasks(tasks: Iterable[asyncio.Future]) -> None:
+    """Cancel ``tasks`` and wait for them, e.g. when a consumer stops early or a fetch fails."""
+    tasks = list(tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _retry_delay(retry_after: str | None, attempt: int) -> float:
+    """Return the seconds to wait before retry ``attempt + 1``.
+
+    ``Retry-After`` may hold either a number of seconds or an HTTP date; when
+    it is missing or unreadable the delay backs off exponentially.
+    """
+    delay = None
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                pass
+            else:
+                if retry_at.tzinfo is None:
+                    retry_at = retry_at.replace(tzinfo=timezone.utc)
+                delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    if delay is None:
+        delay = 2**attempt
+    return min(MAX_RETRY_DELAY, max(0.0, delay))
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limit in-flight requests, adapting the limit to how often the API throttles.
+
+    After every ``window`` completed requests the limit is halved if more than
+    ``overload_rate`` of them were rate limited, otherwise it grows by one
+    (additive increase, multiplicative decrease).
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        window: int = 20,
+        overload_rate: float = 0.1,
+    ) -> None:
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.limit = max_limit
+        self.window = window
+        self.overload_rate = overload_rate
+        self._in_flight = 0
+        self._completed = 0
+        self._throttled = 0
+        self._condition = asyncio.Condition()
+
+    def record_throttled(self) -> None:
+        """Record a rate limited response for the current window."""
+        self._throttled += 1
+
+    async def __aenter__(self) -> AdaptiveConcurrencyLimiter:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._completed += 1
+            if self._completed >= self.window:
+                if self._throttled / self._completed > self.overload_rate:
+                    self.limit = max(self.min_limit, self.limit // 2)
+                else:
+                    self.limit = min(self.max_limit, self.limit + 1)
+                self._completed = 0
+                self._throttled = 0
+            # wake only as many waiters as there are free slots; waking every
+            # waiter on each release is quadratic in the queued requests
+            free_slots = self.limit - self._in_flight
+            if free_slots > 0:
+                self._condition.notify(free_slots)
+
+
 class HubSpotPaginator(BaseHATEOASPaginator):
     def get_next_url(self, response):
-        data = response.json()
+        data = orjson.loads(response.content)
         if data.get("hasMore"):
             return data.get("offset")
 
 class HubSpotStream(RESTStream):
     """HubSpot stream class."""
 
+    # set by each aiohttp based stream before it sends requests
+    _limiter: AdaptiveConcurrencyLimiter
+
     @property
     def url_base(self) -> str:
         """Return the API URL root, configurable via tap settings."""
@@ -37,9 +199,9 @@ class HubSpotStream(RESTStream):
     # Set this value or override `get_new_paginator`.
     next_page_token_jsonpath = "$.next_page"
 
-    @property
+    @cached_property
     def authenticator(self) -> BearerTokenAuthenticator:
-        """Return a new authenticator object.
+        """Return the authenticator object, created once per stream.
 
         Returns:
             An authenticator instance.
@@ -49,6 +211,15 @@ class HubSpotStream(RESTStream):
             token=self.config.get("access_token", ""),
         )
 
+    @property
+    def requests_session(self) -> requests.Session:
+        """Return the module level session shared by all HubSpot streams.
+
+        Returns:
+            The :class:`requests.Session` object for HTTP requests.
+        """
+        return _SESSION
+
     @property
     def http_headers(self) -> dict:
         """Return the http headers needed.
@@ -61,6 +232,188 @@ class HubSpotStream(RESTStream):
             headers["User-Agent"] = self.config.get("user_agent")
         return headers
 
+    def config_int(self, key: str, default: int) -> int:
+        """Return an integer setting, accepting the string values Meltano passes.
+
+        Args:
+            key: The setting name.
+            default: Value used when the setting is missing or empty.
+
+        Returns:
+            The setting as an integer.
+        """
+        value = self.config.get(key)
+        if value is None or value == "":
+            return default
+        return int(float(value))
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the aiohttp session shared by streams with the same config.
+
+        Returns:
+            The :class:`aiohttp.ClientSession` object for HTTP requests.
+        """
+        headers = {**self.http_headers, **self.authenticator.auth_headers}
+        # size the pool to the configured concurrency so the limiters in
+        # the streams, not the connector, decide how many requests run
+        max_concurrency = self.config_int("max_concurrency", MAX_CONCURRENCY)
+        key = (tuple(sorted(headers.items())), max_concurrency)
+        session = _AIOHTTP_SESSIONS.get(key)
+        if session is None or session.closed:
+            session = _AIOHTTP_SESSIONS[key] = aiohttp.ClientSession(
+                headers=headers,
+                connector=aiohttp.TCPConnector(
+                    limit=max_concurrency,
+                    limit_per_host=max_concurrency,
+                    ttl_dns_cache=600,
+                    enable_cleanup_closed=True,
+                    keepalive_timeout=75,
+                ),
+                # no overall cap: large event pages may take a while to stream,
+                # stalled connections are caught by the socket timeouts
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30),
+            )
+        return session
+
+    async def request_json(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        should_stop: Callable[[], bool] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """GET ``url`` within the stream's ``_limiter`` and return the decoded body.
+
+        Rate limited and server error responses, dropped connections and
+        timeouts are retried up to ``MAX_RETRIES`` times, honouring
+        ``Retry-After`` or backing off exponentially. Only 429 responses count
+        as throttling for the limiter.
+
+        Args:
+            session: The aiohttp session to send the request with.
+            url: The URL to request.
+            should_stop: Checked once a limiter slot is free; when it returns
+                true no request is sent and None is returned.
+            kwargs: Passed through to ``session.get``.
+
+        Returns:
+            The JSON response body, or None if stopped.
+        """
+        for attempt in range(MAX_RETRIES):
+            last_attempt = attempt == MAX_RETRIES - 1
+            retry_after = None
+            try:
+                async with self._limiter:
+                    if should_stop is not None and should_stop():
+                        return None
+                    async with session.get(url, **kwargs) as response:
+                        if response.status not in RETRY_STATUSES or last_attempt:
+                            response.raise_for_status()
+                            return orjson.loads(await response.read())
+                        retry_after = response.headers.get("Retry-After")
+                        if response.status == 429:
+                            self._limiter.record_throttled()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if last_attempt:
+                    raise
+            # back off outside the limiter so waiting requests keep their slots
+            delay = _retry_delay(retry_after, attempt)
+            await asyncio.sleep(delay + random.uniform(0, 1))
+
+    async def fan_out(
+        self,
+        coro_fn: Callable[[Any], Awaitable[Any]],
+        items: Sequence[Any],
+    ) -> AsyncIterator[Any]:
+        """Await ``coro_fn(item)`` for every item and yield results as they complete.
+
+        A fixed pool of ``max_concurrency`` workers pulls the items and hands
+        the results over a bounded queue, so only the calls in flight and the
+        queued results are held in memory, and the workers pause whenever the
+        consumer falls behind. The stream's ``_limiter`` still bounds the
+        requests in flight. Outstanding calls are cancelled if the consumer
+        stops early or a call fails.
+
+        Args:
+            coro_fn: Coroutine function called with each item.
+            items: The items to fan out over.
+
+        Yields:
+            Each call's result, in completion order.
+        """
+        total_no_of_requests = len(items)
+        pending = iter(items)
+        queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+
+        async def work() -> None:
+            # the workers share one iterator, so each item is taken once
+            try:
+                for item in pending:
+                    await queue.put(await coro_fn(item))
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(_DONE)
+
+        workers = [
+            asyncio.ensure_future(work())
+            for _ in range(self.config_int("max_concurrency", MAX_CONCURRENCY))
+        ]
+        running = len(workers)
+        completed = 0
+        try:
+            while running:
+                result = await queue.get()
+                if result is _DONE:
+                    running -= 1
+                    continue
+                if isinstance(result, Exception):
+                    raise result
+                completed += 1
+                if completed % 100 == 0 or completed == total_no_of_requests:
+                    self.logger.info(
+                        f"{completed} of {total_no_of_requests} {self.name} requests are completed"
+                    )
+                yield result
+        finally:
+            await cancel_tasks(workers)
+
+    def run_async(self, coroutine: Any) -> Any:
+        """Run a coroutine on the event loop shared by all streams and wait for it.
+
+        Args:
+            coroutine: The coroutine or other awaitable to run.
+
+        Returns:
+            The coroutine's result.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            _await(coroutine), _get_event_loop()
+        ).result()
+
+    def iterate_async(self, async_iterator: AsyncIterator) -> Iterable[Any]:
+        """Yield the items of an async generator from synchronous code.
+
+        Each item is awaited on the shared event loop, so records can be
+        emitted as soon as they arrive instead of after the whole fetch. The
+        loop keeps running the pending requests while the caller handles
+        each item.
+
+        Args:
+            async_iterator: The async generator to consume.
+
+        Yields:
+            Each item produced by the async generator.
+        """
+        try:
+            while True:
+                try:
+                    yield self.run_async(async_iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self.run_async(async_iterator.aclose())
+
     def get_new_paginator(self) -> BaseAPIPaginator:
         """Create a new pagination helper instance.
 
@@ -125,7 +478,26 @@ class HubSpotStream(RESTStream):
         Yields:
             Each record from the source.
         """
-        yield from extract_jsonpath(self.records_jsonpath, input=response.json())
+        yield from extract_jsonpath(
+            self.records_jsonpath, input=orjson.loads(response.content)
+        )
+
+    def get_records(self, context: dict | None) -> Iterable[dict[str, Any]]:
+        """Return a generator of record-type dictionary objects.
+
+        When a stream keeps the default ``post_process``, records are yielded
+        straight from the responses instead of being passed through it.
+
+        Args:
+            context: The stream context.
+
+        Yields:
+            One item per (possibly processed) record in the API.
+        """
+        if type(self).post_process is HubSpotStream.post_process:
+            yield from self.request_records(context)
+        else:
+            yield from super().get_records(context)
 
     def post_process(
         self,
@@ -11,13 +11,24 @@
 """
 
 from __future__ import annotations
+from itertools import islice
 from typing import Any, Iterable
 
+import orjson
+import requests
 from singer_sdk import typing as th
 from tap_hubspot.client import HubSpotStream
 
 API_VERSION = "v1"
 
+_SCHEMA = th.PropertiesList(
+    th.Property("id", th.IntegerType),
+    th.Property("groupId", th.IntegerType),
+    th.Property("lastUpdatedTime", th.IntegerType),
+    th.Property("appId", th.IntegerType),
+    th.Property("appName", th.StringType),
+).to_dict()
+
 
 class EamilCampaignsStream(HubSpotStream):
     """
@@ -29,30 +40,31 @@ class EamilCampaignsStream(HubSpotStream):
     replication_key = "lastUpdatedTime"
     path = f"/email/public/{API_VERSION}/campaigns?limit=1000"
 
-    records_jsonpath = "$.campaigns[:]"
+    schema = _SCHEMA
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # contexts of the campaigns synced by this tap run, read by the
+        # campaign details and email events streams
+        self.campaign_id_contexts: list[dict] = []
+        self._seen_campaign_ids: set[int] = set()
 
-    schema = th.PropertiesList(
-        th.Property("id", th.IntegerType),
-        th.Property("groupId", th.IntegerType),
-        th.Property("lastUpdatedTime", th.IntegerType),
-        th.Property("appId", th.IntegerType),
-        th.Property("appName", th.StringType),
-    ).to_dict()
+    def get_child_context(self, record: dict, context: dict | None) -> dict:
+        return {"campaign_id": record["id"], "app_id": record["appId"]}
 
-    campaign_id_contexts = []
+    def parse_response(self, response: requests.Response) -> Iterable[dict]:
+        yield from orjson.loads(response.content).get("campaigns", ())
 
     def get_records(self, context: dict | None) -> Iterable[dict[str, Any]]:
-        campaigns_limit = (
-            int(float(self.config.get("campaigns_limit", -1)))
-            if self.config.get("campaigns_limit") != ""
-            else -1
-        )
-        record_count = 0
-        for record in super().get_records(context):
-            if campaigns_limit != -1 and campaigns_limit == record_count:
-                break
-            record_count += 1
-            self.campaign_id_contexts.append(
-                {"campaign_id": record["id"], "app_id": record["appId"]}
-            )
+        campaigns_limit = self.config_int("campaigns_limit", -1)
+        records = super().get_records(context)
+        if campaigns_limit >= 0:
+            records = islice(records, campaigns_limit)
+        for record in records:
+            # pages can overlap, only hand each campaign to the child streams once
+            if record["id"] not in self._seen_campaign_ids:
+                self._seen_campaign_ids.add(record["id"])
+                self.campaign_id_contexts.append(
+                    self.get_child_context(record, context)
+                )
             yield record
@@ -22,58 +22,81 @@ from tap_hubspot.hubspot_streams.email_subscriptions_stream import (
     EmailSubscriptionsStream,
 )
 
+_CONFIG_SCHEMA = th.PropertiesList(
+    th.Property(
+        "access_token",
+        th.StringType,
+        required=True,
+        secret=True,
+        description="The token to authenticate against the API service",
+    ),
+    th.Property(
+        "api_base_url",
+        th.StringType,
+        default="http://api.hubapi.com",
+        description="The base url for the API service",
+    ),
+    th.Property(
+        "campaigns_limit",
+        th.StringType,
+        default="-1",
+        description="Used to limit how many records to be returned. -1 to get all records",
+    ),
+    th.Property(
+        "email_events_limit",
+        th.StringType,
+        default="-1",
+        description="Used to limit how many records to be returned. -1 to get all records",
+    ),
+    th.Property(
+        "email_events_start_timestamp",
+        th.StringType,
+        description="Only return events which occurred at or after the given timestamp (in milliseconds since epoch)",
+    ),
+    th.Property(
+        "email_events_end_timestamp",
+        th.StringType,
+        description="Only return events which occurred at or before the given timestamp (in milliseconds since epoch)",
+    ),
+    th.Property(
+        "email_events_type",
+        th.StringType,
+        description="Only return events of the specified type (case-sensitive)",
+    ),
+    th.Property(
+        "email_events_exclude_filtered_events",
+        th.StringType,
+        description="Only return events that have not been filtered out due to customer filtering settings. The default value is false",
+    ),
+    th.Property(
+        "email_events_time_windows",
+        th.StringType,
+        default="1",
+        description="Number of time ranges fetched in parallel for campaigns with more than one page of events. Only used when a start timestamp is known. Each split campaign costs one extra request, as its first full-range page is only used to detect that more pages exist",
+    ),
+    th.Property(
+        "max_concurrency",
+        th.StringType,
+        default="32",
+        description="Maximum number of concurrent requests sent to the API service",
+    ),
+).to_dict()
+
+
 class TapHubSpot(Tap):
     """HubSpot tap class."""
 
     name = "tap-hubspot"
 
-    config_jsonschema = th.PropertiesList(
-        th.Property(
-            "access_token",
-            th.StringType,
-            required=True,
-            secret=True,
-            description="The token to authenticate against the API service",
-        ),
-        th.Property(
-            "api_base_url",
-            th.StringType,
-            default="http://api.hubapi.com",
-            description="The base url for the API service",
-        ),
-        th.Property(
-            "campaigns_limit",
-            th.StringType,
-            default="-1",
-            description="Used to limit how many records to be returned. -1 to get all records",
-        ),
-        th.Property(
-            "email_events_limit",
-            th.StringType,
-            default="-1",
-            description="Used to limit how many records to be returned. -1 to get all records",
-        ),
-        th.Property(
-            "email_events_start_timestamp",
-            th.StringType,
-            description="Only return events which occurred at or after the given timestamp (in milliseconds since epoch)",
-        ),
-        th.Property(
-            "email_events_end_timestamp",
-            th.StringType,
-            description="Only return events which occurred at or before the given timestamp (in milliseconds since epoch)",
-        ),
-        th.Property(
-            "email_events_type",
-            th.StringType,
-            description="Only return events of the specified type (case-sensitive)",
-        ),
-        th.Property(
-            "email_events_exclude_filtered_events",
-            th.StringType,
-            description="Only return events that have not been filtered out due to customer filtering settings. The default value is false",
-        ),
-    ).to_dict()
+    config_jsonschema = _CONFIG_SCHEMA
+
+    # in sync order: each stream reads the contexts collected by the ones before it
+    _STREAM_CLASSES = (
+        EamilCampaignsStream,
+        EamilCampaignDetailsStream,
+        EmailEventsStream,
+        EmailSubscriptionsStream,
+    )
 
     def discover_streams(self) -> list[HubSpotStream]:
         """Return a list of discovered streams.
@@ -81,12 +104,7 @@ class TapHubSpot(Tap):
         Returns:
             A list of discovered streams.
         """
-        return [
-            EamilCampaignsStream(self),
-            EamilCampaignDetailsStream(self),
-            EmailEventsStream(self),
-            EmailSubscriptionsStream(self),
-        ]
+        return [stream_class(self) for stream_class in self._STREAM_CLASSES]
 
     def load_streams(self) -> list[Stream]:
         """Load streams from discovery and initialize DAG.
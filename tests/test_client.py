@@ -0,0 +1,264 @@
+"""Tests for the shared HubSpot client helpers."""
+
+from __future__ import annotations
+
+import aiohttp
+import asyncio
+import pytest
+import weakref
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from tap_hubspot import client
+from tap_hubspot.client import (
+    MAX_RETRIES,
+    MAX_RETRY_DELAY,
+    QUEUE_SIZE,
+    AdaptiveConcurrencyLimiter,
+    _retry_delay,
+)
+from tap_hubspot.tap import TapHubSpot
+
+
+def test_retry_delay_reads_seconds():
+    assert _retry_delay("7", 0) == 7
+    assert _retry_delay("3600", 0) == MAX_RETRY_DELAY
+
+
+def test_retry_delay_reads_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    delay = _retry_delay(format_datetime(retry_at, usegmt=True), 0)
+
+    assert 25 <= delay <= 30
+
+
+def test_retry_delay_caps_http_date_and_ignores_past_dates():
+    later = datetime.now(timezone.utc) + timedelta(hours=1)
+    earlier = datetime.now(timezone.utc) - timedelta(hours=1)
+
+    assert _retry_delay(format_datetime(later, usegmt=True), 0) == MAX_RETRY_DELAY
+    assert _retry_delay(format_datetime(earlier, usegmt=True), 0) == 0
+
+
+def test_retry_delay_backs_off_without_usable_header():
+    assert _retry_delay(None, 3) == 8
+    assert _retry_delay("soon", 2) == 4
+    assert _retry_delay(None, 10) == MAX_RETRY_DELAY
+
+
+def test_limiter_grows_after_a_quiet_window():
+    async def run():
+        limiter = AdaptiveConcurrencyLimiter(4, window=2)
+        limiter.limit = 2
+        for _ in range(2):
+            async with limiter:
+                pass
+        return limiter.limit
+
+    assert asyncio.run(run()) == 3
+
+
+def test_limiter_shrinks_when_throttled_and_respects_bounds():
+    async def run():
+        limiter = AdaptiveConcurrencyLimiter(8, min_limit=2, window=2)
+        limits = []
+        for _ in range(3):
+            for _ in range(2):
+                async with limiter:
+                    limiter.record_throttled()
+            limits.append(limiter.limit)
+        for _ in range(2):
+            async with limiter:
+                pass
+        limits.append(limiter.limit)
+        return limits
+
+    assert asyncio.run(run()) == [4, 2, 2, 3]
+
+
+def test_limiter_caps_requests_in_flight():
+    async def run():
+        limiter = AdaptiveConcurrencyLimiter(3)
+        in_flight = peak = 0
+
+        async def request():
+            nonlocal in_flight, peak
+            async with limiter:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+
+        await asyncio.gather(*(request() for _ in range(50)))
+        return peak
+
+    assert asyncio.run(run()) == 3
+
+
+def request_json(statuses, monkeypatch, **headers):
+    """Run ``request_json`` against a local server answering with ``statuses``.
+
+    Returns the decoded body (or raised exception) and the number of hits.
+    """
+    monkeypatch.setattr(client.random, "uniform", lambda a, b: 0)
+    monkeypatch.setattr(client, "_retry_delay", lambda retry_after, attempt: 0)
+    tap = TapHubSpot(config={"access_token": "token"}, parse_env_config=False)
+    stream = tap.streams["email_campaign_details"]
+    responses = iter(statuses)
+    hits = 0
+
+    async def handler(request):
+        nonlocal hits
+        hits += 1
+        status = next(responses)
+        return web.json_response({"status": status}, status=status, headers=headers)
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/", handler)
+        stream._limiter = AdaptiveConcurrencyLimiter(4)
+        async with TestServer(app) as server, aiohttp.ClientSession() as session:
+            try:
+                return await stream.request_json(session, str(server.make_url("/")))
+            except aiohttp.ClientResponseError as error:
+                return error
+
+    return asyncio.run(run()), hits
+
+
+@pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+def test_request_json_retries_throttling_and_server_errors(status, monkeypatch):
+    body, hits = request_json([status, status, 200], monkeypatch, **{"Retry-After": "1"})
+
+    assert body == {"status": 200}
+    assert hits == 3
+
+
+def test_request_json_gives_up_after_max_retries(monkeypatch):
+    error, hits = request_json([503] * MAX_RETRIES, monkeypatch)
+
+    assert isinstance(error, aiohttp.ClientResponseError)
+    assert error.status == 503
+    assert hits == MAX_RETRIES
+
+
+@pytest.mark.parametrize("status", [400, 401, 404])
+def test_request_json_raises_client_errors_without_retrying(status, monkeypatch):
+    error, hits = request_json([status], monkeypatch)
+
+    assert isinstance(error, aiohttp.ClientResponseError)
+    assert error.status == status
+    assert hits == 1
+
+
+class Payload:
+    """A stand-in for a response body that can be tracked with weak references."""
+
+
+def test_fan_out_releases_results_once_yielded():
+    tap = TapHubSpot(
+        config={"access_token": "token", "max_concurrency": "4"},
+        parse_env_config=False,
+    )
+    stream = tap.streams["email_campaign_details"]
+    alive = weakref.WeakSet()
+
+    async def fetch(item):
+        await asyncio.sleep(0)
+        payload = Payload()
+        alive.add(payload)
+        return payload
+
+    async def run():
+        yielded = peak = 0
+        async for payload in stream.fan_out(fetch, range(2000)):
+            yielded += 1
+            peak = max(peak, len(alive))
+            del payload
+        return yielded, peak
+
+    yielded, peak = asyncio.run(run())
+
+    assert yielded == 2000
+    # only the queued results and the one being handled are kept, never the
+    # results already yielded
+    assert peak <= QUEUE_SIZE + 4 + 1
+    assert len(alive) == 0
+
+
+def test_fan_out_yields_every_result_once():
+    tap = TapHubSpot(config={"access_token": "token"}, parse_env_config=False)
+    stream = tap.streams["email_campaign_details"]
+
+    async def fetch(item):
+        await asyncio.sleep(0)
+        return item
+
+    async def run():
+        return [result async for result in stream.fan_out(fetch, range(500))]
+
+    assert sorted(asyncio.run(run())) == list(range(500))
+
+
+def test_fan_out_cancels_outstanding_calls_on_early_stop():
+    tap = TapHubSpot(config={"access_token": "token"}, parse_env_config=False)
+    stream = tap.streams["email_campaign_details"]
+    cancelled = []
+
+    async def fetch(item):
+        if item == 0:
+            return item
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+
+    async def run():
+        responses = stream.fan_out(fetch, [0, 1, 2])
+        first = await responses.__anext__()
+        await responses.aclose()
+        return first
+
+    assert asyncio.run(run()) == 0
+    assert sorted(cancelled) == [1, 2]
+
+
+def test_fan_out_raises_a_failed_call():
+    tap = TapHubSpot(config={"access_token": "token"}, parse_env_config=False)
+    stream = tap.streams["email_campaign_details"]
+
+    async def fetch(item):
+        if item == 3:
+            raise ValueError(item)
+        return item
+
+    async def run():
+        return [result async for result in stream.fan_out(fetch, range(10))]
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+
+
+def test_get_session_is_shared_per_config_only():
+    def session_for(**config):
+        tap = TapHubSpot(
+            config={"access_token": "token", **config}, parse_env_config=False
+        )
+        stream = tap.streams["email_campaign_details"]
+        return stream.run_async(stream.get_session())
+
+    shared = session_for()
+    other_token = session_for(access_token="other")
+    other_pool = session_for(max_concurrency="8")
+
+    assert session_for() is shared
+    assert other_token is not shared
+    assert other_token.headers["Authorization"] == "Bearer other"
+    assert shared.headers["Authorization"] == "Bearer token"
+    assert other_pool is not shared
+    assert other_pool.connector.limit == 8
@@ -1,7 +1,5 @@
 """Tests standard tap features using the built-in SDK tests library."""
 
-import datetime
-
 from singer_sdk.testing import get_tap_test_class
 
 from tap_hubspot.tap import TapHubSpot
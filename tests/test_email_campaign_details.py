@@ -0,0 +1,39 @@
+"""Tests for the campaign details stream, run offline against stubbed responses."""
+
+from __future__ import annotations
+
+import asyncio
+
+from tap_hubspot.client import QUEUE_SIZE
+from tap_hubspot.tap import TapHubSpot
+
+MAX_CONCURRENCY = 4
+
+
+def test_campaign_details_fetch_only_ahead_of_the_consumer_by_a_bounded_amount():
+    tap = TapHubSpot(
+        config={"access_token": "token", "max_concurrency": str(MAX_CONCURRENCY)},
+        parse_env_config=False,
+    )
+    tap.streams["email_campaigns"].campaign_id_contexts = [
+        {"campaign_id": campaign_id, "app_id": 1} for campaign_id in range(2000)
+    ]
+    stream = tap.streams["email_campaign_details"]
+    fetched = 0
+
+    async def request_json(session, url, should_stop=None, **kwargs):
+        nonlocal fetched
+        await asyncio.sleep(0)
+        fetched += 1
+        return {"id": int(url.rsplit("/", 1)[1]), "appId": 1}
+
+    stream.request_json = request_json
+    consumed = 0
+    ahead = 0
+    for _ in stream.get_records(None):
+        consumed += 1
+        ahead = max(ahead, fetched - consumed)
+
+    assert consumed == 2000
+    # the responses in flight and queued, never the whole detail set
+    assert ahead <= QUEUE_SIZE + MAX_CONCURRENCY
@@ -0,0 +1,112 @@
+"""Tests for the email events stream, run offline against stubbed responses."""
+
+from __future__ import annotations
+
+import pytest
+
+from tap_hubspot.tap import TapHubSpot
+
+PAGE_SIZE = 1000
+
+
+def events_stream(created: range, **config: str):
+    """Return an email events stream for one campaign with stubbed events.
+
+    The stub serves one event per ``created`` timestamp, honouring the
+    ``startTimestamp``/``endTimestamp`` window and paging like HubSpot.
+    """
+    tap = TapHubSpot(
+        config={"access_token": "token", **config}, parse_env_config=False
+    )
+    tap.streams["email_campaigns"].campaign_id_contexts = [
+        {"campaign_id": 1, "app_id": 2}
+    ]
+    stream = tap.streams["email_events"]
+    stream.requested_windows = []
+
+    async def request_json(session, url, should_stop=None, **kwargs):
+        if should_stop is not None and should_stop():
+            return None
+        params = kwargs["params"]
+        lower = int(params.get("startTimestamp", created.start))
+        upper = int(params.get("endTimestamp", created.stop - 1))
+        offset = int(params.get("offset", 0))
+        if offset == 0:
+            stream.requested_windows.append((lower, upper))
+        events = [
+            {"id": str(timestamp), "created": timestamp}
+            for timestamp in created
+            if lower <= timestamp <= upper
+        ]
+        return {
+            "events": events[offset : offset + PAGE_SIZE],
+            "hasMore": offset + PAGE_SIZE < len(events),
+            "offset": str(offset + PAGE_SIZE),
+        }
+
+    stream.request_json = request_json
+    return stream
+
+
+@pytest.mark.parametrize("limit", [5, 1000, 1500])
+def test_email_events_limit_is_exact(limit):
+    stream = events_stream(range(3 * PAGE_SIZE), email_events_limit=str(limit))
+
+    records = list(stream.get_records(None))
+
+    assert len(records) == limit
+    assert len({record["id"] for record in records}) == limit
+
+
+def test_email_events_without_limit_reads_every_page():
+    stream = events_stream(range(3 * PAGE_SIZE))
+
+    records = list(stream.get_records(None))
+
+    assert len(records) == 3 * PAGE_SIZE
+
+
+@pytest.mark.parametrize("windows", [2, 3, 7])
+def test_email_events_time_windows_have_no_gaps_or_overlaps(windows):
+    created = range(1000, 4500)
+    stream = events_stream(
+        created,
+        email_events_time_windows=str(windows),
+        email_events_start_timestamp=str(created.start),
+        email_events_end_timestamp=str(created.stop - 1),
+    )
+
+    records = list(stream.get_records(None))
+
+    assert sorted(record["created"] for record in records) == list(created)
+    # the full-range probe followed by one window per shard
+    probe, *shards = stream.requested_windows
+    assert probe == (created.start, created.stop - 1)
+    assert len(shards) == windows
+    shards.sort()
+    assert shards[0][0] == created.start
+    assert shards[-1][1] == created.stop - 1
+    for (_, upper), (lower, _) in zip(shards, shards[1:]):
+        assert lower == upper + 1
+
+
+def test_email_events_single_page_is_not_split():
+    created = range(1000, 1500)
+    stream = events_stream(
+        created,
+        email_events_time_windows="4",
+        email_events_start_timestamp=str(created.start),
+    )
+
+    records = list(stream.get_records(None))
+
+    assert len(records) == len(created)
+    assert len(stream.requested_windows) == 1
+
+
+def test_email_events_negative_limit_means_no_limit():
+    stream = events_stream(range(3 * PAGE_SIZE), email_events_limit="-5")
+
+    records = list(stream.get_records(None))
+
+    assert len(records) == 3 * PAGE_SIZE